@@ -0,0 +1,83 @@
+"""Move tasks older than the archive horizon into the archived_tasks table.
+
+Usage: ``python -m app.archive [--horizon-days N] [--chunk-size N]``
+
+Rows are moved in small committed chunks (copy, then delete, in one
+transaction), so the job can be stopped and rerun at any time. Chunks walk the
+primary key, so one run reads the tasks table once. Each chunk also raises the
+owners' ``users.archived_before`` watermark; TaskService reads merge archived
+rows back in whenever a query reaches below it, so a run with a different
+horizon never hides tasks.
+"""
+import argparse
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import select, insert, delete, update, or_
+
+from .core.config import settings
+from .core.database import SessionLocal, create_tables
+from .models.archive_model import ArchivedTask, ARCHIVED_COLUMNS
+from .models.format_model import Format  # noqa: F401 - registers models referenced by relationships
+from .models.task_model import Task
+from .models.user_model import User
+
+def archive_tasks(cutoff: date, chunk_size: int) -> int:
+    """Move every task dated before cutoff; returns the number of rows moved"""
+    create_tables()
+    session = SessionLocal()
+    moved = 0
+    last_id = 0
+    
+    try:
+        while True:
+            rows = session.execute(
+                select(Task.id, Task.user_id)
+                .where(Task.id > last_id, Task.date < cutoff)
+                .order_by(Task.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+            ids = [row.id for row in rows]
+            last_id = ids[-1]
+            
+            session.execute(
+                update(User).where(
+                    User.id.in_(list({row.user_id for row in rows})),
+                    or_(User.archived_before.is_(None), User.archived_before < cutoff)
+                ).values(archived_before=cutoff),
+                execution_options={"synchronize_session": False}
+            )
+            session.execute(
+                insert(ArchivedTask).from_select(
+                    ARCHIVED_COLUMNS,
+                    select(*(getattr(Task, column) for column in ARCHIVED_COLUMNS)).where(Task.id.in_(ids))
+                )
+            )
+            session.execute(
+                delete(Task).where(Task.id.in_(ids)),
+                execution_options={"synchronize_session": False}
+            )
+            session.commit()
+            moved += len(ids)
+    finally:
+        session.close()
+    
+    return moved
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive tasks older than the horizon")
+    parser.add_argument("--horizon-days", type=int, default=settings.archive_horizon_days,
+                        help="Archive tasks dated more than this many days ago")
+    parser.add_argument("--chunk-size", type=int, default=settings.archive_chunk_size,
+                        help="Tasks moved per transaction")
+    args = parser.parse_args()
+    
+    cutoff = date.today() - timedelta(days=args.horizon_days)
+    started = time.monotonic()
+    moved = archive_tasks(cutoff, args.chunk_size)
+    print(f"Archived {moved} tasks dated before {cutoff} in {time.monotonic() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Adaptive admission control and load shedding per route class.
+
+Each class (auth, read, write, heavy) has its own concurrency limit and a bounded
+FIFO queue. Requests wait in the queue no longer than the queue timeout. They
+are rejected with 503 and Retry-After when the queue is full, the deadline
+passes, or the class's observed latency is already above target. Limits adapt
+AIMD-style: they shrink when latency overshoots the target and grow back while
+latency stays well under it.
+"""
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from .config import settings
+
+# Paths under the API prefix served by the heavy class
+HEAVY_PREFIXES = ("/tasks/summary/", "/tasks/date-range", "/tasks/batch", "/tasks/reschedule", "/sync/")
+
+# Smoothing factor for the latency moving average
+LATENCY_ALPHA = 0.2
+
+# Minimum seconds between two limit decreases
+DECREASE_INTERVAL = 1.0
+
+
+def _parse_pairs(value: str) -> Dict[str, float]:
+    """Parse "name=value,name=value" into a dict"""
+    pairs = {}
+    for item in value.split(","):
+        if "=" in item:
+            name, number = item.split("=", 1)
+            pairs[name.strip()] = float(number)
+    return pairs
+
+
+def classify(method: str, path: str) -> Optional[str]:
+    """Route class for a request, or None if it bypasses admission control"""
+    if method == "OPTIONS" or not path.startswith(settings.api_v1_str):
+        return None
+    path = path[len(settings.api_v1_str):]
+    if path.startswith("/events"):
+        # Long-lived streams would pin a slot for their whole lifetime
+        return None
+    if path.startswith("/auth/"):
+        return "auth"
+    if path.startswith(HEAVY_PREFIXES) or (method == "DELETE" and path.rstrip("/") == "/tasks"):
+        return "heavy"
+    if method in ("GET", "HEAD"):
+        return "read"
+    return "write"
+
+
+class Overloaded(Exception):
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+
+
+class AdmissionClass:
+    """Concurrency limiter with a bounded deadline queue and adaptive limit"""
+
+    def __init__(self, name: str, max_limit: int, latency_target: float, queue_timeout: float):
+        self.name = name
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self.latency_target = latency_target
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_limit * 2
+        self.active = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.latency = 0.0
+        self.admitted = 0
+        self.rejected = 0
+        self._last_decrease = 0.0
+
+    def retry_after(self) -> int:
+        backlog = (len(self.waiters) + 1) / max(1, self.limit)
+        return max(1, math.ceil(backlog * max(self.latency, self.latency_target)))
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+
+        # Fail fast rather than queue behind a class that is already too slow
+        if len(self.waiters) >= self.max_queue or self.latency > self.latency_target:
+            self.rejected += 1
+            raise Overloaded(self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            # A slot handed over just as the deadline fired is ours; pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._free_slot()
+            self.rejected += 1
+            raise Overloaded(self.retry_after())
+        except BaseException:
+            # Cancelled after a slot was handed over; pass it on instead of leaking it
+            if waiter.done() and not waiter.cancelled():
+                self._free_slot()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+        # The slot was handed over by release(), already counted in active
+        self.admitted += 1
+
+    def release(self, elapsed: float) -> None:
+        self.latency = elapsed if self.latency == 0.0 else (
+            LATENCY_ALPHA * elapsed + (1 - LATENCY_ALPHA) * self.latency
+        )
+        self._adapt()
+        self._free_slot()
+
+    def _free_slot(self) -> None:
+        self.active -= 1
+        while self.waiters and self.active < self.limit:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    def _adapt(self) -> None:
+        now = time.monotonic()
+        if self.latency > self.latency_target:
+            if now - self._last_decrease >= DECREASE_INTERVAL:
+                self.limit = max(1, int(self.limit * 0.9))
+                self._last_decrease = now
+        elif self.latency < self.latency_target / 2 and self.active >= self.limit:
+            self.limit = min(self.max_limit, self.limit + 1)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "active": self.active,
+            "queued": len(self.waiters),
+            "max_queue": self.max_queue,
+            "latency_ms": round(self.latency * 1000, 1),
+            "latency_target_ms": round(self.latency_target * 1000, 1),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+
+class AdmissionController:
+    def __init__(self):
+        limits = _parse_pairs(settings.admission_limits)
+        targets = _parse_pairs(settings.admission_latency_targets)
+        self.classes = {
+            name: AdmissionClass(name, int(limit), targets.get(name, 1.0), settings.admission_queue_timeout)
+            for name, limit in limits.items()
+        }
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {name: admission_class.stats() for name, admission_class in self.classes.items()}
+
+
+admission = AdmissionController()
+
+
+class AdmissionMiddleware:
+    """ASGI middleware enforcing per-class admission control"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        admission_class = None
+        if scope["type"] == "http":
+            admission_class = admission.classes.get(classify(scope["method"], scope["path"]))
+        if admission_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await admission_class.acquire()
+        except Overloaded as exc:
+            await self._reject(send, exc.retry_after)
+            return
+
+        started = time.monotonic()
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                admission_class.release(time.monotonic() - started)
+
+        async def send_and_release(message):
+            await send(message)
+            # Background tasks run after the response inside the app call; they must
+            # neither hold the slot nor count towards the class's latency
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                release()
+
+        try:
+            await self.app(scope, receive, send_and_release)
+        finally:
+            release()
+
+    @staticmethod
+    async def _reject(send, retry_after: int) -> None:
+        body = json.dumps({"detail": "Server is overloaded, please retry later"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
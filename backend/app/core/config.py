@@ -21,6 +21,64 @@ class Settings(BaseSettings):
         "http://localhost:3000,http://localhost:8080,http://127.0.0.1:3000,http://127.0.0.1:8080"
     )
     
+    # Production server (python -m app.server); WEB_CONCURRENCY=0 means one worker per CPU
+    host: str = os.getenv("HOST", "0.0.0.0")
+    port: int = int(os.getenv("PORT", "8000"))
+    workers: int = int(os.getenv("WEB_CONCURRENCY", "0"))
+    graceful_timeout: int = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+    max_requests: int = int(os.getenv("MAX_REQUESTS", "0"))
+    # Create and upgrade tables in the app's startup event; the production server does it once in its master
+    create_tables_on_startup: bool = os.getenv("CREATE_TABLES_ON_STARTUP", "True").lower() == "true"
+    
+    # Total database connections shared by all workers; keep below Postgres max_connections
+    db_max_connections: int = int(os.getenv("DB_MAX_CONNECTIONS", "60"))
+    
+    # Server-Sent Events: "memory" (single worker) or "postgres" (LISTEN/NOTIFY fan-out)
+    events_backend: str = os.getenv("EVENTS_BACKEND", "memory")
+    events_buffer_size: int = int(os.getenv("EVENTS_BUFFER_SIZE", "1024"))
+    events_queue_size: int = int(os.getenv("EVENTS_QUEUE_SIZE", "64"))
+    events_keepalive_seconds: int = int(os.getenv("EVENTS_KEEPALIVE_SECONDS", "15"))
+    
+    # Maximum operations accepted by POST /tasks/batch
+    batch_max_operations: int = int(os.getenv("BATCH_MAX_OPERATIONS", "200"))
+    
+    # Group commit: coalesce concurrent task creates arriving within the window into one INSERT
+    group_commit_enabled: bool = os.getenv("GROUP_COMMIT_ENABLED", "False").lower() == "true"
+    group_commit_window_ms: float = float(os.getenv("GROUP_COMMIT_WINDOW_MS", "2"))
+    group_commit_max_batch: int = int(os.getenv("GROUP_COMMIT_MAX_BATCH", "100"))
+    
+    # Tasks dated more than this many days ago live in archived_tasks (python -m app.archive)
+    archive_horizon_days: int = int(os.getenv("ARCHIVE_HORIZON_DAYS", "365"))
+    archive_chunk_size: int = int(os.getenv("ARCHIVE_CHUNK_SIZE", "1000"))
+    
+    # Rows deleted per transaction by the background account purge
+    purge_chunk_size: int = int(os.getenv("PURGE_CHUNK_SIZE", "1000"))
+    
+    # Admission control: per-class concurrency limits ("class=n,...") and latency targets in seconds
+    admission_enabled: bool = os.getenv("ADMISSION_ENABLED", "True").lower() == "true"
+    admission_limits: str = os.getenv("ADMISSION_LIMITS", "auth=8,read=32,write=16,heavy=4")
+    admission_latency_targets: str = os.getenv(
+        "ADMISSION_LATENCY_TARGETS", "auth=0.5,read=0.25,write=0.5,heavy=2.0"
+    )
+    admission_queue_timeout: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "2.0"))
+    
+    # Request tracing, exported as JSONL to a rotating local file
+    trace_enabled: bool = os.getenv("TRACE_ENABLED", "False").lower() == "true"
+    trace_sample_rate: float = float(os.getenv("TRACE_SAMPLE_RATE", "0.1"))
+    trace_file: str = os.getenv("TRACE_FILE", "traces.jsonl")
+    trace_max_bytes: int = int(os.getenv("TRACE_MAX_BYTES", str(10 * 1024 * 1024)))
+    trace_backup_count: int = int(os.getenv("TRACE_BACKUP_COUNT", "5"))
+    
+    # Number of users whose formats are cached per worker
+    format_cache_size: int = int(os.getenv("FORMAT_CACHE_SIZE", "1024"))
+    
+    # Delta sync: extra cursor lag on top of the oldest in-flight write (the whole lag
+    # outside Postgres, so keep it above the longest write there), reset threshold,
+    # tombstone retention
+    sync_overlap_seconds: int = int(os.getenv("SYNC_OVERLAP_SECONDS", "5"))
+    sync_max_changes: int = int(os.getenv("SYNC_MAX_CHANGES", "1000"))
+    sync_tombstone_days: int = int(os.getenv("SYNC_TOMBSTONE_DAYS", "30"))
+    
     api_v1_str: str = "/api/v1"
     project_name: str = "Client Updates Backend"
     
@@ -1,16 +1,37 @@
-from sqlalchemy import create_engine
+from datetime import date, timedelta
+from sqlalchemy import create_engine, inspect, text, DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import FunctionElement
 from .config import settings
 
+# Split the connection budget across workers so the total stays under the server limit
+_per_worker_connections = max(2, settings.db_max_connections // max(1, settings.workers))
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
     pool_recycle=300,
+    pool_size=_per_worker_connections // 2,
+    max_overflow=_per_worker_connections - _per_worker_connections // 2,
     echo=settings.debug
 )
 
+# Current wall-clock time; unlike now() on Postgres, not frozen at transaction start
+class clock_now(FunctionElement):
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+@compiles(clock_now)
+def _compile_clock_now(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(clock_now, "postgresql")
+def _compile_clock_now_postgresql(element, compiler, **kw):
+    return "clock_timestamp()"
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -27,4 +48,53 @@ def get_db():
 
 # Create all tables
 def create_tables():
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema()
+
+# Bring tables created by older releases up to date; every step is idempotent
+def upgrade_schema():
+    inspector = inspect(engine)
+    
+    with engine.begin() as conn:
+        task_indexes = {index["name"] for index in inspector.get_indexes("tasks")}
+        if "ix_tasks_user_id_updated_at" not in task_indexes:
+            # Rows from before delta sync have no updated_at and would never be synced
+            conn.execute(text("UPDATE tasks SET updated_at = created_at WHERE updated_at IS NULL"))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_user_id_updated_at ON tasks (user_id, updated_at)"))
+        
+        # Account deletion relies on the database cascading to each user's rows; SQLite
+        # cannot alter constraints and does not enforce them unless asked to
+        if conn.dialect.name == "postgresql":
+            for table in ("tasks", "formats"):
+                for foreign_key in inspector.get_foreign_keys(table):
+                    ondelete = (foreign_key.get("options") or {}).get("ondelete") or ""
+                    if foreign_key["referred_table"] == "users" and ondelete.upper() != "CASCADE":
+                        _cascade_user_foreign_key(conn, table, foreign_key["name"])
+        
+        user_columns = {column["name"] for column in inspector.get_columns("users")}
+        if "formats_version" not in user_columns:
+            _add_column(conn, "users", "formats_version INTEGER NOT NULL DEFAULT 0")
+        if "purge_requested_at" not in user_columns:
+            _add_column(conn, "users", "purge_requested_at TIMESTAMP WITH TIME ZONE")
+        if "archived_before" not in user_columns:
+            _add_column(conn, "users", "archived_before DATE")
+            # Reads only consult the archive below this watermark, so cover rows archived earlier
+            archived = conn.execute(text("SELECT user_id, MAX(date) FROM archived_tasks GROUP BY user_id")).all()
+            for user_id, latest in archived:
+                conn.execute(
+                    text("UPDATE users SET archived_before = :archived_before WHERE id = :user_id"),
+                    {"archived_before": date.fromisoformat(str(latest)) + timedelta(days=1), "user_id": user_id}
+                )
+
+def _add_column(conn, table: str, column_ddl: str):
+    """Add a column, tolerating another process having just added it (SQLite lacks IF NOT EXISTS here)"""
+    if_not_exists = "IF NOT EXISTS " if conn.dialect.name == "postgresql" else ""
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {if_not_exists}{column_ddl}"))
+
+def _cascade_user_foreign_key(conn, table: str, name: str):
+    """Recreate a table's user_id foreign key with ON DELETE CASCADE"""
+    conn.execute(text(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}"))
+    conn.execute(text(
+        f"ALTER TABLE {table} ADD CONSTRAINT {name} "
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE"
+    ))
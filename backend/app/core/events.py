@@ -0,0 +1,252 @@
+import asyncio
+import json
+import logging
+import queue
+import select
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from fastapi.encoders import jsonable_encoder
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres refuses NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD = 7900
+
+
+class Event:
+    """A single change event, rendered as an SSE frame once the broker assigns its id"""
+    __slots__ = ("id", "user_id", "entity", "action", "data", "frame")
+
+    def __init__(self, user_id: int, entity: str, action: str, data: Any):
+        self.id = 0
+        self.user_id = user_id
+        self.entity = entity
+        self.action = action
+        self.data = data
+        self.frame = b""
+
+    def stamp(self, event_id: int) -> None:
+        """Assign the delivery-order id and render once so every subscriber shares the same bytes"""
+        self.id = event_id
+        payload = json.dumps({"entity": self.entity, "action": self.action, "data": self.data})
+        self.frame = f"id: {event_id}\nevent: {self.entity}.{self.action}\ndata: {payload}\n\n".encode()
+
+    def to_payload(self) -> str:
+        return json.dumps({
+            "user_id": self.user_id,
+            "entity": self.entity,
+            "action": self.action,
+            "data": self.data,
+        })
+
+    @classmethod
+    def from_payload(cls, payload: str) -> "Event":
+        raw = json.loads(payload)
+        return cls(raw["user_id"], raw["entity"], raw["action"], raw["data"])
+
+
+class Subscriber:
+    """One open SSE connection; owns a small bounded queue on its event loop"""
+    __slots__ = ("user_id", "loop", "queue")
+
+    def __init__(self, user_id: int, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.user_id = user_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    def offer(self, event: Event) -> None:
+        """Enqueue an event; a slow consumer is cut off and resumes via Last-Event-ID"""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+
+class EventBroker:
+    """In-process fan-out of change events with a bounded replay buffer"""
+
+    def __init__(self, buffer_size: int, queue_size: int):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._buffer: Deque[Event] = deque(maxlen=buffer_size)
+        # Ids are microsecond timestamps: anything older than this broker was never buffered
+        # here (worker restart, or a reconnect landing on another worker), so it must reset
+        self._evicted_id = time.time_ns() // 1000
+        self._last_id = 0
+        self._subscribers: Dict[int, Set[Subscriber]] = {}
+        self.backend = None
+
+    def publish(self, user_id: int, entity: str, action: str, data: Any) -> None:
+        """Publish a change event; call only after the change is committed"""
+        event = Event(user_id, entity, action, jsonable_encoder(data))
+        if self.backend is not None:
+            self.backend.send(event)
+        else:
+            self.dispatch(event)
+
+    def dispatch(self, event: Event) -> None:
+        """Number an event, record it in the replay buffer and hand it to local subscribers"""
+        with self._lock:
+            # Ids are assigned here, in delivery order, so a resume never skips a late arrival.
+            # Microsecond timestamps keep them roughly aligned across workers.
+            self._last_id = max(self._last_id + 1, time.time_ns() // 1000)
+            event.stamp(self._last_id)
+            if len(self._buffer) == self._buffer.maxlen:
+                self._evicted_id = max(self._evicted_id, self._buffer[0].id)
+            self._buffer.append(event)
+            subscribers = list(self._subscribers.get(event.user_id, ()))
+        for subscriber in subscribers:
+            subscriber.loop.call_soon_threadsafe(subscriber.offer, event)
+
+    def subscribe(self, user_id: int) -> Subscriber:
+        """Register a subscriber; must be called from the event loop serving it"""
+        subscriber = Subscriber(user_id, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscriber.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[subscriber.user_id]
+
+    def replay(self, user_id: int, last_event_id: int) -> Optional[List[Event]]:
+        """Events for a user after last_event_id, or None if the buffer no longer covers it"""
+        with self._lock:
+            if last_event_id < self._evicted_id:
+                return None
+            return [e for e in self._buffer if e.user_id == user_id and e.id > last_event_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(s) for s in self._subscribers.values())
+
+
+class PostgresNotifyBackend:
+    """Cross-worker fan-out using Postgres LISTEN/NOTIFY on the existing database.
+
+    Requests only enqueue their events; a sender thread issues the NOTIFYs on its
+    own connection, outside the pool, so publishing never waits on the database
+    or competes with request sessions for pooled connections.
+    """
+    channel = "app_events"
+
+    def __init__(self, broker: EventBroker, engine):
+        self.broker = broker
+        self.engine = engine
+        self._stopping = threading.Event()
+        self._outbox: "queue.Queue[Optional[Event]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        self._threads = [
+            threading.Thread(target=self._listen_forever, name="event-listener", daemon=True),
+            threading.Thread(target=self._send_forever, name="event-sender", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._outbox.put(None)
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+    def send(self, event: Event) -> None:
+        self._outbox.put(event)
+
+    def _payload(self, event: Event) -> str:
+        payload = event.to_payload()
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD:
+            # Too large for NOTIFY; send the id only and let clients refetch
+            data = {"id": event.data.get("id")} if isinstance(event.data, dict) else None
+            payload = Event(event.user_id, event.entity, event.action,
+                            dict(data or {}, truncated=True)).to_payload()
+        return payload
+
+    def _send_forever(self) -> None:
+        conn = None
+        while True:
+            event = self._outbox.get()
+            if event is None:
+                break
+            try:
+                if conn is None:
+                    conn = self._connect()
+                conn.cursor().execute("SELECT pg_notify(%s, %s)", (self.channel, self._payload(event)))
+            except Exception:
+                logger.exception("Event backend send failed, delivering locally")
+                self.broker.dispatch(event)
+                if conn is not None:
+                    conn.close()
+                    conn = None
+        if conn is not None:
+            conn.close()
+
+    def _connect(self):
+        # Detach so long-lived backend connections never occupy a pool slot
+        raw = self.engine.raw_connection()
+        raw.detach()
+        raw.driver_connection.autocommit = True
+        return raw
+
+    def _listen_forever(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Event listener connection lost, reconnecting")
+                self._stopping.wait(1.0)
+
+    def _listen(self) -> None:
+        raw = self._connect()
+        conn = raw.driver_connection
+        try:
+            conn.cursor().execute(f"LISTEN {self.channel}")
+            while not self._stopping.is_set():
+                if select.select([conn], [], [], 1.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    self.broker.dispatch(Event.from_payload(notify.payload))
+        finally:
+            raw.close()
+
+
+broker = EventBroker(settings.events_buffer_size, settings.events_queue_size)
+
+
+def publish_event(user_id: int, entity: str, action: str, data: Any) -> None:
+    """Publish a change event for a user to all of their open streams"""
+    broker.publish(user_id, entity, action, data)
+
+
+def start_event_backend() -> None:
+    """Start the configured cross-worker backend, if any"""
+    if settings.events_backend == "memory" and settings.workers > 1:
+        logger.warning(
+            "EVENTS_BACKEND=memory with %d workers: clients only see changes made on their "
+            "own worker; set EVENTS_BACKEND=postgres for multi-worker deployments",
+            settings.workers
+        )
+    if settings.events_backend == "postgres":
+        from .database import engine
+        broker.backend = PostgresNotifyBackend(broker, engine)
+        broker.backend.start()
+
+
+def stop_event_backend() -> None:
+    if broker.backend is not None:
+        broker.backend.stop()
+        broker.backend = None
@@ -0,0 +1,91 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommitter:
+    """Coalesce concurrent single-row inserts into one multi-row INSERT and one commit.
+
+    Callers block in submit() while a flusher thread collects every request that
+    arrives within the window after the first one (up to max_batch), executes the
+    RETURNING statement once and hands each caller its own row. If the batch fails,
+    rows are retried one transaction each so an error reaches only its own caller.
+    """
+
+    def __init__(self, engine, statement, window: float, max_batch: int):
+        self.engine = engine
+        self.statement = statement
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.rows = 0
+        self._queue: "queue.Queue[Tuple[Dict[str, Any], Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, params: Dict[str, Any]):
+        """Insert one row via the next group commit and return its RETURNING row"""
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((params, future))
+        return future.result()
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "rows": self.rows,
+            "average_batch": round(self.rows / self.batches, 2) if self.batches else 0.0,
+        }
+
+    def _ensure_started(self) -> None:
+        # Started lazily so each forked worker gets its own flusher thread
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        try:
+            with self.engine.begin() as conn:
+                rows = conn.execute(self.statement, [params for params, _ in batch]).all()
+        except Exception:
+            logger.warning("Group commit of %d rows failed, retrying individually", len(batch))
+            for params, future in batch:
+                self._flush_one(params, future)
+            return
+
+        self.batches += 1
+        self.rows += len(rows)
+        for (_, future), row in zip(batch, rows):
+            future.set_result(row)
+
+    def _flush_one(self, params: Dict[str, Any], future: Future) -> None:
+        try:
+            with self.engine.begin() as conn:
+                row = conn.execute(self.statement, [params]).one()
+        except Exception as exc:
+            future.set_exception(exc)
+            return
+
+        self.batches += 1
+        self.rows += 1
+        future.set_result(row)
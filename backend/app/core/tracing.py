@@ -0,0 +1,199 @@
+"""Lightweight request tracing exported to a rotating local JSONL file.
+
+The current span lives in a context variable. Starlette copies the context into
+threadpool workers, so spans opened in sync routes, dependencies, services and
+SQLAlchemy engine events all attach to the request's root span. Unsampled
+requests carry no span and every helper here becomes a no-op.
+"""
+import functools
+import json
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+
+from .config import settings
+
+# Longest SQL statement text recorded on a span
+MAX_STATEMENT_LENGTH = 500
+
+
+class Span:
+    __slots__ = ("trace", "span_id", "parent_id", "name", "start", "duration_ms", "attributes", "error")
+
+    def __init__(self, trace: List["Span"], name: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.start = time.time()
+        self.duration_ms: Optional[float] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+
+    def finish(self) -> None:
+        self.duration_ms = round((time.time() - self.start) * 1000, 3)
+        self.trace.append(self)
+
+    def to_record(self, trace_id: str) -> Dict[str, Any]:
+        return {
+            "trace_id": trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+_exporter = logging.getLogger("app.tracing")
+_exporter.propagate = False
+
+
+def _configure_exporter() -> None:
+    if _exporter.handlers:
+        return
+    handler = RotatingFileHandler(
+        settings.trace_file,
+        maxBytes=settings.trace_max_bytes,
+        backupCount=settings.trace_backup_count
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _exporter.addHandler(handler)
+    _exporter.setLevel(logging.INFO)
+
+
+def _export(spans: List[Span]) -> None:
+    trace_id = os.urandom(16).hex()
+    for span in spans:
+        _exporter.info(json.dumps(span.to_record(trace_id), default=str))
+
+
+@contextmanager
+def trace_span(name: str, **attributes: Any):
+    """Record a child span of the current span, if the request is being traced"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    span = Span(parent.trace, name, parent.span_id, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except Exception as exc:
+        span.error = type(exc).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        span.finish()
+
+
+def traced(func=None, *, name: Optional[str] = None):
+    """Decorator wrapping a function call in a span"""
+    if func is None:
+        return functools.partial(traced, name=name)
+
+    span_name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _current_span.get() is None:
+            return func(*args, **kwargs)
+        with trace_span(span_name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def traced_methods(cls):
+    """Class decorator wrapping every public method in a span named Class.method"""
+    for attr, value in list(vars(cls).items()):
+        if callable(value) and not attr.startswith("_"):
+            setattr(cls, attr, traced(value))
+    return cls
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a sampled root span per HTTP request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or random.random() >= settings.trace_sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        trace: List[Span] = []
+        root = Span(trace, f"{scope['method']} {scope['path']}", None, {})
+        token = _current_span.set(root)
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                root.attributes["status_code"] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as exc:
+            root.error = type(exc).__name__
+            raise
+        finally:
+            _current_span.reset(token)
+            endpoint = scope.get("endpoint")
+            if endpoint is not None:
+                root.attributes["endpoint"] = endpoint.__name__
+            root.finish()
+            _export(trace)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_span.get() is not None:
+        context._trace_span = trace_span("sql", statement=statement[:MAX_STATEMENT_LENGTH])
+        context._trace_span.__enter__()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span_context = getattr(context, "_trace_span", None)
+    if span_context is not None:
+        context._trace_span = None
+        span_context.__exit__(None, None, None)
+
+
+def _handle_error(exception_context):
+    context = exception_context.execution_context
+    span_context = getattr(context, "_trace_span", None) if context is not None else None
+    if span_context is not None:
+        context._trace_span = None
+        span_context.__exit__(
+            type(exception_context.original_exception),
+            exception_context.original_exception,
+            None
+        )
+
+
+def instrument_engine(engine) -> None:
+    """Record a span for every SQL statement executed on the engine"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def setup_tracing(app, engine) -> None:
+    """Enable tracing on the app and engine when TRACE_ENABLED is set"""
+    if not settings.trace_enabled:
+        return
+    _configure_exporter()
+    instrument_engine(engine)
+    app.add_middleware(TracingMiddleware)
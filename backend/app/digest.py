@@ -0,0 +1,140 @@
+"""Generate every active user's daily client update in one pass.
+
+Usage: ``python -m app.digest --date 2024-11-02 [--workers N] [--force]``
+
+Tasks are streamed in a single user-ordered query joined to each user's default
+format, rendered across a process pool and bulk-inserted into the ``digests``
+table. Users that already have a digest for the date are skipped, so an
+interrupted run can simply be restarted.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from datetime import date
+from itertools import groupby
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, insert, delete, and_, exists, union_all
+
+from .core.database import SessionLocal, create_tables, engine
+from .models.archive_model import ArchivedTask
+from .models.digest_model import Digest
+from .models.format_model import Format
+from .models.task_model import Task
+from .models.user_model import User
+from .schemas.task_schema import TaskResponse
+from .utils.helpers import generate_client_update
+
+# (user_id, format_id, template, task rows)
+UserBatch = List[Tuple[int, Optional[int], Optional[str], List[tuple]]]
+
+TASK_COLUMNS = ("id", "user_id", "task_title", "task_desc", "date", "created_at", "updated_at")
+
+def _init_worker():
+    """Never touch connections inherited from the parent process"""
+    engine.dispose(close=False)
+
+def render_batch(batch: UserBatch) -> List[dict]:
+    """Render client updates for a batch of users (runs in a worker process)"""
+    rows = []
+    for user_id, format_id, template, task_rows in batch:
+        tasks = [TaskResponse(**dict(zip(TASK_COLUMNS, task_row))) for task_row in task_rows]
+        rows.append({
+            "user_id": user_id,
+            "format_id": format_id,
+            "content": generate_client_update(tasks, template),
+        })
+    return rows
+
+def stream_user_tasks(session, digest_date: date, yield_per: int):
+    """Yield (user_id, format_id, template, task rows) per user, in user order"""
+    # Archived tasks count too, as they do for GET /tasks/summary/{date}
+    day_tasks = union_all(*(
+        select(*(getattr(model, column) for column in TASK_COLUMNS)).where(model.date == digest_date)
+        for model in (Task, ArchivedTask)
+    )).subquery()
+    stmt = (
+        select(User.id, Format.id, Format.text_format, *(day_tasks.c[column] for column in TASK_COLUMNS))
+        .join(day_tasks, day_tasks.c.user_id == User.id)
+        .outerjoin(Format, and_(Format.user_id == User.id, Format.is_default == True))
+        .where(
+            User.is_active == True,
+            ~exists().where(Digest.user_id == User.id, Digest.digest_date == digest_date)
+        )
+        .order_by(User.id, day_tasks.c.created_at.desc())
+        .execution_options(stream_results=True, yield_per=yield_per)
+    )
+    for user_id, rows in groupby(session.execute(stmt), key=lambda row: row[0]):
+        rows = list(rows)
+        yield user_id, rows[0][1], rows[0][2], [tuple(row[3:]) for row in rows]
+
+def write_digests(session, digest_date: date, rows: List[dict]) -> None:
+    """Bulk-insert rendered digests and commit, making the batch durable for resume"""
+    if rows:
+        session.execute(insert(Digest), [dict(row, digest_date=digest_date) for row in rows])
+        session.commit()
+
+def run(digest_date: date, workers: int, batch_size: int, force: bool) -> int:
+    """Generate digests for a date; returns the number of users processed"""
+    create_tables()
+    read_session = SessionLocal()
+    write_session = SessionLocal()
+    started = time.monotonic()
+    processed = 0
+    
+    try:
+        if force:
+            write_session.execute(delete(Digest).where(Digest.digest_date == digest_date))
+            write_session.commit()
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            pending = deque()
+            batch: UserBatch = []
+            
+            def drain(limit: int) -> None:
+                nonlocal processed
+                while len(pending) > limit:
+                    rows = pending.popleft().result()
+                    write_digests(write_session, digest_date, rows)
+                    processed += len(rows)
+                    elapsed = time.monotonic() - started
+                    print(f"{processed} users, {processed / elapsed:.1f} users/sec", flush=True)
+            
+            for user in stream_user_tasks(read_session, digest_date, batch_size * 10):
+                batch.append(user)
+                if len(batch) >= batch_size:
+                    pending.append(executor.submit(render_batch, batch))
+                    batch = []
+                    # Bound in-flight work so memory stays flat however many users there are
+                    drain(workers * 2)
+            
+            if batch:
+                pending.append(executor.submit(render_batch, batch))
+            drain(0)
+    finally:
+        read_session.close()
+        write_session.close()
+    
+    elapsed = time.monotonic() - started
+    rate = processed / elapsed if elapsed else 0.0
+    print(f"Generated {processed} digests for {digest_date} in {elapsed:.1f}s ({rate:.1f} users/sec)")
+    return processed
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate daily client updates for all active users")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(),
+                        help="Date to summarise (YYYY-MM-DD), defaults to today")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Rendering processes")
+    parser.add_argument("--batch-size", type=int, default=200,
+                        help="Users per rendering batch")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate digests that already exist for the date")
+    args = parser.parse_args()
+    
+    run(args.date, args.workers, args.batch_size, args.force)
+
+if __name__ == "__main__":
+    main()
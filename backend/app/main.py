@@ -3,9 +3,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 
+from .core.admission import AdmissionMiddleware, admission
 from .core.config import settings
-from .core.database import create_tables
-from .routes import auth_routes, task_routes, format_routes
+from .core.database import create_tables, engine
+from .core.events import start_event_backend, stop_event_backend
+from .core.tracing import setup_tracing
+from .services.format_service import format_cache
+from .routes import auth_routes, task_routes, format_routes, event_routes, sync_routes
 
 # Create FastAPI application
 app = FastAPI(
@@ -17,6 +21,11 @@ app = FastAPI(
     redirect_slashes=False  # Disable automatic trailing slash redirects to avoid CORS issues
 )
 
+# Shed load per route class before requests reach the threadpool and DB pool
+# (added before CORS so rejections still carry CORS headers)
+if settings.admission_enabled:
+    app.add_middleware(AdmissionMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -31,6 +40,11 @@ app.add_middleware(
 app.include_router(auth_routes.router, prefix=settings.api_v1_str)
 app.include_router(task_routes.router, prefix=settings.api_v1_str)
 app.include_router(format_routes.router, prefix=settings.api_v1_str)
+app.include_router(event_routes.router, prefix=settings.api_v1_str)
+app.include_router(sync_routes.router, prefix=settings.api_v1_str)
+
+# Request tracing (no-op unless TRACE_ENABLED)
+setup_tracing(app, engine)
 
 # Global exception handler
 @app.exception_handler(Exception)
@@ -53,14 +67,18 @@ async def root():
 async def health_check():
     return {
         "status": "healthy",
-        "database": "connected"
+        "database": "connected",
+        "format_cache": format_cache.stats(),
+        "admission": admission.stats()
     }
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """Create database tables on startup"""
-    create_tables()
+    if settings.create_tables_on_startup:
+        create_tables()
+    start_event_backend()
     print("🚀 Client Updates Backend started successfully!")
     print(f"📚 API Documentation: http://localhost:8000/docs")
     print(f"🔧 Environment: {'Development' if settings.debug else 'Production'}")
@@ -68,6 +86,7 @@ async def startup_event():
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
+    stop_event_backend()
     print("👋 Client Updates Backend shutting down...")
 
 if __name__ == "__main__":
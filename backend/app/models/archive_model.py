@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date, Index
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+# Columns copied between tasks and archived_tasks when rows move in either direction
+ARCHIVED_COLUMNS = ("id", "user_id", "task_title", "task_desc", "date", "created_at", "updated_at")
+
+class ArchivedTask(Base):
+    """Cold-tier copy of a task older than the archive horizon, keeping its original id"""
+    __tablename__ = "archived_tasks"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    task_title = Column(String(200), nullable=False)
+    task_desc = Column(Text, nullable=True)
+    date = Column(Date, nullable=False)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index("ix_archived_tasks_user_id_date", "user_id", "date"),
+    )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, Text, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+class Digest(Base):
+    __tablename__ = "digests"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    digest_date = Column(Date, nullable=False)
+    format_id = Column(Integer, nullable=True)
+    content = Column(Text, nullable=False)
+    generated_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint("user_id", "digest_date", name="uq_digests_user_id_digest_date"),
+    )
@@ -7,7 +7,7 @@ class Format(Base):
     __tablename__ = "formats"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     format_name = Column(String(100), nullable=False)
     text_format = Column(Text, nullable=True)
     image_path = Column(String(500), nullable=True)
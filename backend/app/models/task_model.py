@@ -1,18 +1,24 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from ..core.database import Base
+from ..core.database import Base, clock_now
 
 class Task(Base):
     __tablename__ = "tasks"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     task_title = Column(String(200), nullable=False)
     task_desc = Column(Text, nullable=True)
     date = Column(Date, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Set on insert as well so delta sync sees new rows through one index; stamped with the
+    # statement's clock time so a long transaction cannot stamp rows behind issued cursors
+    updated_at = Column(DateTime(timezone=True), default=clock_now(), server_default=func.now(), onupdate=clock_now())
     
     # Relationships
-    user = relationship("User", back_populates="tasks")
\ No newline at end of file
+    user = relationship("User", back_populates="tasks")
+    
+    __table_args__ = (
+        Index("ix_tasks_user_id_updated_at", "user_id", "updated_at"),
+    )
\ No newline at end of file
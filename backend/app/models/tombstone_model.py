@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from ..core.database import Base, clock_now
+
+class TaskTombstone(Base):
+    __tablename__ = "task_tombstones"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    task_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), default=clock_now(), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_task_tombstones_user_id_deleted_at", "user_id", "deleted_at"),
+    )
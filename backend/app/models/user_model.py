@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..core.database import Base
@@ -11,9 +11,16 @@ class User(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
+    # Bumped on every format change; lets each worker validate its format cache
+    formats_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Set when a background account deletion is requested; pending until the purge deletes the row
+    purge_requested_at = Column(DateTime(timezone=True), nullable=True)
+    # All of the user's archived tasks are dated before this; None means none are archived
+    archived_before = Column(Date, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan")
-    formats = relationship("Format", back_populates="user", cascade="all, delete-orphan")
\ No newline at end of file
+    # Child rows are removed by ON DELETE CASCADE, never loaded just to be deleted
+    tasks = relationship("Task", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    formats = relationship("Format", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""Finish account purges that were requested but never completed.
+
+Usage: ``python -m app.purge [--chunk-size N]``
+
+DELETE /auth/me?background=true marks the user with purge_requested_at and
+purges in a background task. If that task fails or its worker dies, the user
+stays marked; this command purges every marked user. It is idempotent and safe
+to run from cron.
+"""
+import argparse
+import logging
+import time
+
+from .core.config import settings
+from .core.database import SessionLocal, create_tables
+from .models.format_model import Format  # noqa: F401 - registers models referenced by relationships
+from .models.task_model import Task  # noqa: F401
+from .services.auth_service import AuthService
+
+logger = logging.getLogger(__name__)
+
+def resume_purges(chunk_size: int) -> int:
+    """Purge every user marked for purge; returns the number of users purged"""
+    create_tables()
+    session = SessionLocal()
+    purged = 0
+    
+    try:
+        auth_service = AuthService(session)
+        for user_id in auth_service.get_pending_purges():
+            try:
+                auth_service.purge_user(user_id, chunk_size)
+                purged += 1
+            except Exception:
+                # Leave the user marked so the next run retries it
+                session.rollback()
+                logger.exception("Purge of user %s failed", user_id)
+    finally:
+        session.close()
+    
+    return purged
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume pending account purges")
+    parser.add_argument("--chunk-size", type=int, default=settings.purge_chunk_size,
+                        help="Rows deleted per transaction")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    started = time.monotonic()
+    purged = resume_purges(args.chunk_size)
+    print(f"Purged {purged} accounts in {time.monotonic() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
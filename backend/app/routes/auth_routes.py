@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from ..core.database import get_db
+from ..core.config import settings
+from ..core.database import get_db, SessionLocal
 from ..schemas.user_schema import UserCreate, UserLogin, UserResponse, Token
 from ..services.auth_service import AuthService
 from ..utils.jwt_handler import verify_token
@@ -25,7 +26,23 @@ def get_current_user(
         )
     
     auth_service = AuthService(db)
-    return auth_service.get_user_by_email(email)
+    user = auth_service.get_user_by_email(email)
+    
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    
+    return user
+
+def purge_user(user_id: int):
+    """Background job: delete a user's data in chunks; python -m app.purge resumes it if it fails"""
+    db = SessionLocal()
+    try:
+        AuthService(db).purge_user(user_id, settings.purge_chunk_size)
+    finally:
+        db.close()
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(user_data: UserCreate, db: Session = Depends(get_db)):
@@ -51,6 +68,24 @@ def get_current_user_info(current_user = Depends(get_current_user)):
     """Get current user information"""
     return current_user
 
+@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
+def delete_current_user(
+    background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Deactivate now and purge data in the background"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete the current user's account and all of their data"""
+    auth_service = AuthService(db)
+    
+    if background:
+        auth_service.request_purge(current_user)
+        background_tasks.add_task(purge_user, current_user.id)
+    else:
+        auth_service.delete_user(current_user)
+    
+    return
+
 @router.post("/refresh", response_model=Token)
 def refresh_token(current_user = Depends(get_current_user), db: Session = Depends(get_db)):
     """Refresh access token"""
@@ -0,0 +1,63 @@
+import asyncio
+from fastapi import APIRouter, Depends, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from ..core.config import settings
+from ..core.database import get_db
+from ..core.events import broker
+from ..routes.auth_routes import get_current_user
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+async def event_stream(user_id: int, last_event_id: Optional[int]):
+    """Yield SSE frames for a user, replaying from the buffer when resuming"""
+    subscriber = broker.subscribe(user_id)
+    try:
+        yield b"retry: 3000\n\n"
+
+        replayed_id = 0
+        if last_event_id is not None:
+            missed = broker.replay(user_id, last_event_id)
+            if missed is None:
+                # Gap is older than the buffer; client must refetch its lists
+                yield b"event: reset\ndata: {}\n\n"
+            else:
+                for event in missed:
+                    replayed_id = event.id
+                    yield event.frame
+
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    subscriber.queue.get(), timeout=settings.events_keepalive_seconds
+                )
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+
+            if event is None:
+                # Queue overflowed; close so the client reconnects with Last-Event-ID
+                return
+            if event.id > replayed_id:
+                yield event.frame
+    finally:
+        broker.unsubscribe(subscriber)
+
+@router.get("/")
+async def stream_events(
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Stream task and format changes for the current user as Server-Sent Events"""
+    user_id = current_user.id
+    # Release the pooled connection; the stream itself needs no database access
+    await run_in_threadpool(db.close)
+
+    return StreamingResponse(
+        event_stream(user_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime
+from ..core.database import get_db
+from ..schemas.sync_schema import TaskSyncResponse
+from ..services.sync_service import SyncService
+from ..routes.auth_routes import get_current_user
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+@router.get("/tasks", response_model=TaskSyncResponse)
+def sync_tasks(
+    since: Optional[datetime] = Query(None, description="Cursor returned by the previous sync"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get task changes since a cursor"""
+    sync_service = SyncService(db)
+    return sync_service.get_task_changes(current_user, since)
@@ -3,7 +3,10 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 from ..core.database import get_db
-from ..schemas.task_schema import TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, DailySummary
+from ..schemas.task_schema import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, DailySummary,
+    TaskBatchRequest, TaskBatchResponse, TaskReschedule, TaskBulkResult
+)
 from ..services.task_service import TaskService
 from ..routes.auth_routes import get_current_user
 
@@ -20,6 +23,16 @@ def create_task(
     task = task_service.create_task(task_data, current_user)
     return task
 
+@router.post("/batch", response_model=TaskBatchResponse)
+def batch_tasks(
+    batch: TaskBatchRequest,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Apply an ordered list of create/update/delete operations in one transaction"""
+    task_service = TaskService(db)
+    return task_service.execute_batch(batch.operations, current_user, batch.atomic)
+
 @router.get("/", response_model=TaskListResponse)
 def get_tasks(
     task_date: Optional[date] = Query(None, description="Filter tasks by date"),
@@ -36,6 +49,35 @@ def get_tasks(
         total=len(tasks)
     )
 
+@router.delete("/", response_model=TaskBulkResult)
+def delete_tasks_by_date_range(
+    start_date: date = Query(..., description="First date to delete"),
+    end_date: date = Query(..., description="Last date to delete"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete all tasks within a date range"""
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Start date must be before or equal to end date"
+        )
+    
+    task_service = TaskService(db)
+    affected = task_service.delete_tasks_by_date_range(current_user, start_date, end_date)
+    return TaskBulkResult(affected=affected)
+
+@router.patch("/reschedule", response_model=TaskBulkResult)
+def reschedule_tasks(
+    reschedule: TaskReschedule,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Move all tasks from one date to another"""
+    task_service = TaskService(db)
+    affected = task_service.reschedule_tasks(current_user, reschedule.from_date, reschedule.to_date)
+    return TaskBulkResult(affected=affected)
+
 @router.get("/{task_id}", response_model=TaskResponse)
 def get_task(
     task_id: int,
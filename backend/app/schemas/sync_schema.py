@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+from .task_schema import TaskResponse
+
+# Task Delta Sync Response
+class TaskSyncResponse(BaseModel):
+    tasks: List[TaskResponse]
+    deleted: List[int]
+    cursor: datetime
+    reset: bool = False
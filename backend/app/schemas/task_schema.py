@@ -1,16 +1,17 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime, date
+from ..core.config import settings
 
 # Task Creation Schema
 class TaskCreate(BaseModel):
-    task_title: str
+    task_title: str = Field(..., max_length=200)
     task_desc: Optional[str] = None
     date: date
 
 # Task Update Schema
 class TaskUpdate(BaseModel):
-    task_title: Optional[str] = None
+    task_title: Optional[str] = Field(None, max_length=200)
     task_desc: Optional[str] = None
     date: Optional[date] = None
 
@@ -36,4 +37,48 @@ class TaskListResponse(BaseModel):
 class DailySummary(BaseModel):
     date: date
     tasks: List[TaskResponse]
-    summary_text: Optional[str] = None
\ No newline at end of file
+    summary_text: Optional[str] = None
+
+# Reschedule Request Schema
+class TaskReschedule(BaseModel):
+    from_date: date
+    to_date: date
+
+# Bulk Mutation Result
+class TaskBulkResult(BaseModel):
+    affected: int
+
+# Batch Operation Schema
+class TaskBatchOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    task_id: Optional[int] = None
+    data: Optional[Dict[str, Any]] = None
+
+# Batch Request Schema
+class TaskBatchRequest(BaseModel):
+    operations: List[TaskBatchOperation] = Field(..., max_length=settings.batch_max_operations)
+    atomic: bool = True
+    
+    @field_validator('operations', mode='before')
+    @classmethod
+    def limit_operations(cls, v):
+        """Reject oversized batches before validating each operation"""
+        if isinstance(v, list) and len(v) > settings.batch_max_operations:
+            raise ValueError(f"Batch exceeds {settings.batch_max_operations} operations")
+        return v
+
+# Batch Operation Result
+class TaskBatchResult(BaseModel):
+    index: int
+    op: str
+    status_code: int
+    task_id: Optional[int] = None
+    task: Optional[TaskResponse] = None
+    detail: Optional[str] = None
+
+# Batch Response Schema
+class TaskBatchResponse(BaseModel):
+    results: List[TaskBatchResult]
+    committed: bool
+    succeeded: int
+    failed: int
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""Production entry point: gunicorn supervising uvicorn workers.
+
+Run with ``python -m app.server``. Send SIGHUP to the master process for a
+graceful rolling restart; SIGTERM drains in-flight requests before exiting.
+"""
+import multiprocessing
+from gunicorn.app.base import BaseApplication
+from .core.config import settings
+
+def resolve_workers() -> int:
+    """Configured worker count, or one per CPU"""
+    return settings.workers or multiprocessing.cpu_count()
+
+def on_starting(server):
+    """Create and upgrade the schema once in the master, before any worker boots"""
+    from .core.database import create_tables, engine
+    from .models import archive_model, digest_model, format_model, task_model, tombstone_model, user_model  # noqa: F401
+    create_tables()
+    engine.dispose()
+
+def post_fork(server, worker):
+    """Drop pooled connections inherited from the master so processes never share sockets"""
+    from .core.database import engine
+    engine.dispose(close=False)
+
+class ProductionServer(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+    
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+    
+    def load(self):
+        from .main import app
+        return app
+
+def main():
+    # Must be set before the database module is imported so pools are sized per worker
+    settings.workers = resolve_workers()
+    # Workers inherit this; concurrent schema upgrades from every worker would race
+    settings.create_tables_on_startup = False
+    
+    options = {
+        "bind": f"{settings.host}:{settings.port}",
+        "workers": settings.workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "graceful_timeout": settings.graceful_timeout,
+        "max_requests": settings.max_requests,
+        "max_requests_jitter": settings.max_requests // 10,
+        "on_starting": on_starting,
+        "post_fork": post_fork,
+    }
+    ProductionServer(options).run()
+
+if __name__ == "__main__":
+    main()
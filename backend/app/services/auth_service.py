@@ -1,9 +1,19 @@
+from typing import List
+from sqlalchemy import select, delete
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 from fastapi import HTTPException, status
+from ..core.tracing import traced_methods
+from ..models.archive_model import ArchivedTask
+from ..models.digest_model import Digest
+from ..models.format_model import Format
+from ..models.task_model import Task
+from ..models.tombstone_model import TaskTombstone
 from ..models.user_model import User
 from ..schemas.user_schema import UserCreate, UserLogin
 from ..utils.jwt_handler import verify_password, get_password_hash, create_access_token
 
+@traced_methods
 class AuthService:
     def __init__(self, db: Session):
         self.db = db
@@ -62,4 +72,47 @@ class AuthService:
     
     def create_user_token(self, user: User) -> str:
         """Create access token for user"""
-        return create_access_token(data={"sub": user.email})
\ No newline at end of file
+        return create_access_token(data={"sub": user.email})
+    
+    def delete_user(self, user: User) -> None:
+        """Delete a user; the database cascades to tasks, formats and other owned rows"""
+        self.db.execute(
+            delete(User).where(User.id == user.id),
+            execution_options={"synchronize_session": False}
+        )
+        self.db.commit()
+    
+    def request_purge(self, user: User) -> None:
+        """Lock a user out and mark the account for purge; survives a failed or lost purge job"""
+        user.is_active = False
+        user.purge_requested_at = func.now()
+        self.db.commit()
+    
+    def get_pending_purges(self) -> List[int]:
+        """Ids of users marked for purge whose data has not been fully deleted yet"""
+        return self.db.scalars(
+            select(User.id).where(User.purge_requested_at.is_not(None)).order_by(User.id)
+        ).all()
+    
+    def purge_user(self, user_id: int, chunk_size: int) -> None:
+        """Delete a user's data in small committed chunks, then the user itself.
+        
+        Each transaction touches at most chunk_size rows, so memory and lock time stay
+        constant however long the account's history is.
+        """
+        for model in (Task, ArchivedTask, TaskTombstone, Digest, Format):
+            while True:
+                chunk = select(model.id).where(model.user_id == user_id).limit(chunk_size).scalar_subquery()
+                result = self.db.execute(
+                    delete(model).where(model.id.in_(chunk)),
+                    execution_options={"synchronize_session": False}
+                )
+                self.db.commit()
+                if result.rowcount < chunk_size:
+                    break
+        
+        self.db.execute(
+            delete(User).where(User.id == user_id),
+            execution_options={"synchronize_session": False}
+        )
+        self.db.commit()
\ No newline at end of file
@@ -1,10 +1,18 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from ..core.cache import VersionedCache
+from ..core.config import settings
+from ..core.events import publish_event
+from ..core.tracing import traced_methods
 from ..models.format_model import Format
 from ..models.user_model import User
-from ..schemas.format_schema import FormatCreate, FormatUpdate
+from ..schemas.format_schema import FormatCreate, FormatUpdate, FormatResponse
 
+# Per-worker cache of each user's formats, keyed by user id and tagged with users.formats_version
+format_cache = VersionedCache(settings.format_cache_size)
+
+@traced_methods
 class FormatService:
     def __init__(self, db: Session):
         self.db = db
@@ -27,16 +35,16 @@ class FormatService:
         )
         
         self.db.add(db_format)
-        self.db.commit()
+        self._commit_format_change(user)
         self.db.refresh(db_format)
         
+        publish_event(user.id, "format", "created", FormatResponse.from_orm(db_format))
         return db_format
     
-    def get_user_formats(self, user: User) -> List[Format]:
-        """Get all formats for a user"""
-        return self.db.query(Format).filter(
-            Format.user_id == user.id
-        ).order_by(Format.is_default.desc(), Format.created_at.desc()).all()
+    def get_user_formats(self, user: User) -> List[FormatResponse]:
+        """Get all formats for a user, served from the format cache when current"""
+        formats, _ = self._cached_formats(user)
+        return list(formats)
     
     def get_format_by_id(self, format_id: int, user: User) -> Format:
         """Get a specific format by ID for the user"""
@@ -69,9 +77,10 @@ class FormatService:
         for field, value in update_data.items():
             setattr(format_obj, field, value)
         
-        self.db.commit()
+        self._commit_format_change(user)
         self.db.refresh(format_obj)
         
+        publish_event(user.id, "format", "updated", FormatResponse.from_orm(format_obj))
         return format_obj
     
     def delete_format(self, format_id: int, user: User) -> bool:
@@ -79,16 +88,15 @@ class FormatService:
         format_obj = self.get_format_by_id(format_id, user)
         
         self.db.delete(format_obj)
-        self.db.commit()
+        self._commit_format_change(user)
         
+        publish_event(user.id, "format", "deleted", {"id": format_id})
         return True
     
-    def get_default_format(self, user: User) -> Optional[Format]:
-        """Get user's default format"""
-        return self.db.query(Format).filter(
-            Format.user_id == user.id,
-            Format.is_default == True
-        ).first()
+    def get_default_format(self, user: User) -> Optional[FormatResponse]:
+        """Get user's default format, served from the format cache when current"""
+        _, default_format = self._cached_formats(user)
+        return default_format
     
     def set_default_format(self, format_id: int, user: User) -> Format:
         """Set a format as default"""
@@ -102,7 +110,38 @@ class FormatService:
         format_obj = self.get_format_by_id(format_id, user)
         format_obj.is_default = True
         
-        self.db.commit()
+        self._commit_format_change(user)
         self.db.refresh(format_obj)
         
-        return format_obj
\ No newline at end of file
+        # A format arriving with is_default=True implies every other default was cleared
+        publish_event(user.id, "format", "updated", FormatResponse.from_orm(format_obj))
+        return format_obj
+    
+    def _cached_formats(self, user: User) -> Tuple[List[FormatResponse], Optional[FormatResponse]]:
+        """Get a user's formats and default format, loading them on a cache miss"""
+        # Read the version before the formats so a concurrent write can only make us reload
+        version = user.formats_version
+        cached = format_cache.get(user.id, version)
+        if cached is not None:
+            return cached
+        
+        formats = [
+            FormatResponse.from_orm(format_obj)
+            for format_obj in self.db.query(Format).filter(
+                Format.user_id == user.id
+            ).order_by(Format.is_default.desc(), Format.created_at.desc()).all()
+        ]
+        default_format = next((format_obj for format_obj in formats if format_obj.is_default), None)
+        
+        cached = (tuple(formats), default_format)
+        format_cache.put(user.id, version, cached)
+        return cached
+    
+    def _commit_format_change(self, user: User) -> None:
+        """Commit a format change and invalidate cached formats in every worker"""
+        self.db.query(User).filter(User.id == user.id).update(
+            {User.formats_version: User.formats_version + 1},
+            synchronize_session=False
+        )
+        self.db.commit()
+        format_cache.invalidate(user.id)
\ No newline at end of file
@@ -0,0 +1,76 @@
+from sqlalchemy import select, delete, text
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from ..core.config import settings
+from ..core.database import clock_now
+from ..models.task_model import Task
+from ..models.tombstone_model import TaskTombstone
+from ..models.user_model import User
+from ..schemas.sync_schema import TaskSyncResponse
+
+class SyncService:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_task_changes(self, user: User, since: Optional[datetime] = None) -> TaskSyncResponse:
+        """Get tasks created, updated or deleted after a sync cursor.
+        
+        The returned cursor trails the start of the oldest write transaction still in
+        flight, plus a small overlap, so rows those transactions commit later are picked
+        up next time; clients should apply changes idempotently. A reset tells the
+        client to refetch its full task list.
+        """
+        now = self.db.scalar(select(clock_now()))
+        cursor = self._oldest_write_start(now) - timedelta(seconds=settings.sync_overlap_seconds)
+        horizon = now - timedelta(days=settings.sync_tombstone_days)
+        if since is not None and since.tzinfo is None and now.tzinfo is not None:
+            since = since.replace(tzinfo=timezone.utc)
+        
+        self._prune_tombstones(user, horizon)
+        
+        # Tombstones older than the horizon are gone, so older cursors cannot be served
+        if since is None or since < horizon:
+            return TaskSyncResponse(tasks=[], deleted=[], cursor=cursor, reset=True)
+        
+        tasks = self.db.query(Task).filter(
+            Task.user_id == user.id,
+            Task.updated_at > since
+        ).order_by(Task.updated_at).limit(settings.sync_max_changes + 1).all()
+        
+        deleted = self.db.scalars(
+            select(TaskTombstone.task_id).where(
+                TaskTombstone.user_id == user.id,
+                TaskTombstone.deleted_at > since
+            ).limit(settings.sync_max_changes + 1)
+        ).all()
+        
+        if len(tasks) + len(deleted) > settings.sync_max_changes:
+            return TaskSyncResponse(tasks=[], deleted=[], cursor=cursor, reset=True)
+        
+        return TaskSyncResponse(tasks=tasks, deleted=deleted, cursor=cursor)
+    
+    def _oldest_write_start(self, now: datetime) -> datetime:
+        """Start of the oldest open transaction that has written anything, capped at now.
+        
+        Rows are stamped with the clock when written, never before their transaction
+        began, so nothing committed after this call can be stamped earlier.
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return now
+        oldest = self.db.scalar(text(
+            "SELECT min(xact_start) FROM pg_stat_activity "
+            "WHERE backend_xid IS NOT NULL AND datname = current_database()"
+        ))
+        return now if oldest is None else min(now, oldest)
+    
+    def _prune_tombstones(self, user: User, horizon: datetime) -> None:
+        """Drop a user's tombstones that have aged past the retention window"""
+        result = self.db.execute(
+            delete(TaskTombstone).where(
+                TaskTombstone.user_id == user.id,
+                TaskTombstone.deleted_at < horizon
+            )
+        )
+        if result.rowcount:
+            self.db.commit()
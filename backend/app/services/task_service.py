@@ -1,46 +1,80 @@
+from sqlalchemy import delete, update, insert
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError, DataError
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 from typing import List, Optional
 from datetime import date
+from ..core.config import settings
+from ..core.database import engine
+from ..core.events import publish_event
+from ..core.group_commit import GroupCommitter
+from ..core.tracing import traced_methods, trace_span
+from ..models.archive_model import ArchivedTask, ARCHIVED_COLUMNS
 from ..models.task_model import Task
+from ..models.tombstone_model import TaskTombstone
 from ..models.user_model import User
-from ..schemas.task_schema import TaskCreate, TaskUpdate, TaskResponse
+from ..schemas.task_schema import (
+    TaskCreate, TaskUpdate, TaskResponse,
+    TaskBatchOperation, TaskBatchResult, TaskBatchResponse
+)
 from ..utils.helpers import generate_client_update
 
+# Copied back when an archived task is edited; updated_at is stamped afresh for delta sync
+RESTORED_COLUMNS = tuple(column for column in ARCHIVED_COLUMNS if column != "updated_at")
+
+# Coalesces concurrent create_task calls when GROUP_COMMIT_ENABLED is set
+task_group_committer = GroupCommitter(
+    engine,
+    insert(Task).returning(*Task.__table__.columns, sort_by_parameter_order=True),
+    settings.group_commit_window_ms / 1000,
+    settings.group_commit_max_batch
+)
+
+@traced_methods
 class TaskService:
     def __init__(self, db: Session):
         self.db = db
     
     def create_task(self, task_data: TaskCreate, user: User) -> Task:
         """Create a new task for user"""
-        db_task = Task(
-            user_id=user.id,
-            task_title=task_data.task_title,
-            task_desc=task_data.task_desc,
-            date=task_data.date
-        )
-        
-        self.db.add(db_task)
-        self.db.commit()
-        self.db.refresh(db_task)
+        user_id = user.id
+        if settings.group_commit_enabled:
+            values = self._task_values(task_data, user)
+            # Hand the request's connection back to the pool before waiting on the flusher,
+            # which needs one of its own; nothing may touch the expired user after this
+            self.db.commit()
+            # Shares one INSERT and commit with concurrent creates; the row comes back detached
+            row = task_group_committer.submit(values)
+            db_task = Task(**row._mapping)
+        else:
+            db_task = self._add_task(task_data, user)
+            self.db.commit()
+            self.db.refresh(db_task)
         
+        publish_event(user_id, "task", "created", TaskResponse.from_orm(db_task))
         return db_task
     
     def get_user_tasks(self, user: User, task_date: Optional[date] = None, limit: int = 100) -> List[Task]:
-        """Get tasks for a user, optionally filtered by date"""
-        query = self.db.query(Task).filter(Task.user_id == user.id)
+        """Get tasks for a user, optionally filtered by date, including archived history"""
+        tasks = self._task_query(Task, user, task_date, task_date).limit(limit).all()
+        
+        needs_archive = self._reaches_archive(user, task_date)
+        if needs_archive and not task_date:
+            # The hot table alone is enough unless it ran out of rows before the archive
+            needs_archive = len(tasks) < limit or tasks[-1].date < user.archived_before
         
-        if task_date:
-            query = query.filter(Task.date == task_date)
+        if not needs_archive:
+            return tasks
         
-        return query.order_by(Task.date.desc(), Task.created_at.desc()).limit(limit).all()
+        archived = self._task_query(ArchivedTask, user, task_date, task_date).limit(limit).all()
+        return self._merge_archived(tasks, archived)[:limit]
     
     def get_task_by_id(self, task_id: int, user: User) -> Task:
-        """Get a specific task by ID for the user"""
-        task = self.db.query(Task).filter(
-            Task.id == task_id,
-            Task.user_id == user.id
-        ).first()
+        """Get a specific task by ID for the user, including archived tasks"""
+        task = self._find_task(Task, task_id, user)
+        if not task and self._reaches_archive(user, None):
+            task = self._find_task(ArchivedTask, task_id, user)
         
         if not task:
             raise HTTPException(
@@ -52,33 +86,280 @@ class TaskService:
     
     def update_task(self, task_id: int, task_data: TaskUpdate, user: User) -> Task:
         """Update a task"""
-        task = self.get_task_by_id(task_id, user)
-        
-        update_data = task_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(task, field, value)
-        
+        task = self._apply_update(task_id, task_data, user)
         self.db.commit()
         self.db.refresh(task)
         
+        publish_event(user.id, "task", "updated", TaskResponse.from_orm(task))
         return task
     
     def delete_task(self, task_id: int, user: User) -> bool:
         """Delete a task"""
         task = self.get_task_by_id(task_id, user)
         
-        self.db.delete(task)
+        self._remove_task(task)
         self.db.commit()
         
+        publish_event(user.id, "task", "deleted", {"id": task_id})
         return True
     
+    def delete_tasks_by_date_range(self, user: User, start_date: date, end_date: date) -> int:
+        """Delete every task in a date range, archived ones included, with one statement per table"""
+        models = (Task, ArchivedTask) if self._reaches_archive(user, start_date) else (Task,)
+        deleted_ids = []
+        for model in models:
+            deleted_ids += self.db.execute(
+                delete(model).where(
+                    model.user_id == user.id,
+                    model.date >= start_date,
+                    model.date <= end_date
+                ).returning(model.id),
+                execution_options={"synchronize_session": False}
+            ).scalars().all()
+        if deleted_ids:
+            self.db.execute(
+                insert(TaskTombstone),
+                [{"user_id": user.id, "task_id": task_id} for task_id in deleted_ids]
+            )
+        self.db.commit()
+        
+        if deleted_ids:
+            publish_event(user.id, "task", "bulk_deleted", {"ids": deleted_ids})
+        return len(deleted_ids)
+    
+    def reschedule_tasks(self, user: User, from_date: date, to_date: date) -> int:
+        """Move every task on one date to another with one statement per table"""
+        moved_ids = self.db.execute(
+            update(Task).where(
+                Task.user_id == user.id,
+                Task.date == from_date
+            ).values(date=to_date).returning(Task.id),
+            execution_options={"synchronize_session": False}
+        ).scalars().all()
+        
+        if self._reaches_archive(user, from_date):
+            # Archived tasks being changed move back to the hot table
+            restored = self.db.execute(
+                delete(ArchivedTask).where(
+                    ArchivedTask.user_id == user.id,
+                    ArchivedTask.date == from_date
+                ).returning(*(getattr(ArchivedTask, column) for column in RESTORED_COLUMNS)),
+                execution_options={"synchronize_session": False}
+            ).all()
+            if restored:
+                self.db.execute(insert(Task), [dict(row._mapping, date=to_date) for row in restored])
+                moved_ids += [row.id for row in restored]
+        self.db.commit()
+        
+        if moved_ids:
+            publish_event(user.id, "task", "rescheduled", {"ids": moved_ids, "date": to_date})
+        return len(moved_ids)
+    
+    def execute_batch(self, operations: List[TaskBatchOperation], user: User, atomic: bool = True) -> TaskBatchResponse:
+        """Run create/update/delete operations in order within a single transaction.
+        
+        Atomic batches stop at the first failure and roll everything back. Best-effort
+        batches wrap each operation in a savepoint and commit whatever succeeded.
+        """
+        if len(operations) > settings.batch_max_operations:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Batch exceeds {settings.batch_max_operations} operations"
+            )
+        
+        results: List[TaskBatchResult] = []
+        applied = []
+        for index, operation in enumerate(operations):
+            savepoint = None if atomic else self.db.begin_nested()
+            try:
+                task = self._apply_operation(operation, user)
+                self.db.flush()
+            except (HTTPException, ValidationError, IntegrityError, DataError) as exc:
+                if savepoint is not None:
+                    savepoint.rollback()
+                results.append(self._batch_failure(index, operation, exc))
+                if atomic:
+                    break
+                continue
+            
+            if savepoint is not None:
+                savepoint.commit()
+            result = TaskBatchResult(
+                index=index,
+                op=operation.op,
+                task_id=operation.task_id if task is None else task.id,
+                status_code={"create": 201, "update": 200, "delete": 204}[operation.op]
+            )
+            results.append(result)
+            applied.append((result, task))
+        
+        failed = sum(1 for result in results if result.status_code >= 400)
+        if atomic and failed:
+            self.db.rollback()
+            for result, _ in applied:
+                result.task_id = operations[result.index].task_id
+                result.status_code = status.HTTP_424_FAILED_DEPENDENCY
+                result.detail = "Rolled back"
+            for index in range(len(results), len(operations)):
+                results.append(TaskBatchResult(
+                    index=index,
+                    op=operations[index].op,
+                    task_id=operations[index].task_id,
+                    status_code=status.HTTP_424_FAILED_DEPENDENCY,
+                    detail="Not executed"
+                ))
+            return TaskBatchResponse(results=results, committed=False, succeeded=0, failed=len(results))
+        
+        self.db.commit()
+        
+        # A task deleted later in the batch gets no payload or event for its earlier operations
+        surviving, deleted_later = set(), set()
+        for result, task in reversed(applied):
+            if task is None:
+                deleted_later.add(result.task_id)
+            elif result.task_id not in deleted_later:
+                surviving.add(result.index)
+        
+        # Reload every surviving row in one query rather than one refresh per task
+        live_ids = [result.task_id for result, _ in applied if result.index in surviving]
+        if live_ids:
+            self.db.query(Task).filter(Task.id.in_(live_ids)).all()
+        
+        for result, task in applied:
+            if task is None:
+                publish_event(user.id, "task", "deleted", {"id": result.task_id})
+                continue
+            if result.index not in surviving:
+                continue
+            result.task = TaskResponse.from_orm(task)
+            publish_event(user.id, "task", "created" if result.op == "create" else "updated", result.task)
+        
+        return TaskBatchResponse(
+            results=results,
+            committed=True,
+            succeeded=len(results) - failed,
+            failed=failed
+        )
+    
+    def _add_task(self, task_data: TaskCreate, user: User) -> Task:
+        """Stage a new task in the session without committing"""
+        db_task = Task(**self._task_values(task_data, user))
+        self.db.add(db_task)
+        return db_task
+    
+    def _task_values(self, task_data: TaskCreate, user: User) -> dict:
+        """Column values for a new task"""
+        return {
+            "user_id": user.id,
+            "task_title": task_data.task_title,
+            "task_desc": task_data.task_desc,
+            "date": task_data.date
+        }
+    
+    def _apply_update(self, task_id: int, task_data: TaskUpdate, user: User) -> Task:
+        """Apply field changes to a task without committing"""
+        task = self._get_live_task(task_id, user)
+        
+        update_data = task_data.dict(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(task, field, value)
+        
+        return task
+    
+    def _apply_operation(self, operation: TaskBatchOperation, user: User) -> Optional[Task]:
+        """Stage one batch operation; returns the task, or None for deletes"""
+        if operation.op == "create":
+            return self._add_task(TaskCreate(**(operation.data or {})), user)
+        
+        if operation.task_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="task_id is required"
+            )
+        
+        if operation.op == "update":
+            return self._apply_update(operation.task_id, TaskUpdate(**(operation.data or {})), user)
+        
+        self._remove_task(self.get_task_by_id(operation.task_id, user))
+        return None
+    
+    def _find_task(self, model, task_id: int, user: User):
+        """A user's task by id from the hot or archived table, or None"""
+        return self.db.query(model).filter(
+            model.id == task_id,
+            model.user_id == user.id
+        ).first()
+    
+    def _get_live_task(self, task_id: int, user: User) -> Task:
+        """Get a task to edit, staging an archived one's move back to the hot table"""
+        task = self.get_task_by_id(task_id, user)
+        
+        if isinstance(task, ArchivedTask):
+            self.db.delete(task)
+            task = Task(**{column: getattr(task, column) for column in RESTORED_COLUMNS})
+            self.db.add(task)
+        
+        return task
+    
+    def _remove_task(self, task: Task) -> None:
+        """Stage a task deletion, hot or archived, and its tombstone for delta sync"""
+        self.db.delete(task)
+        self.db.add(TaskTombstone(user_id=task.user_id, task_id=task.id))
+    
+    def _batch_failure(self, index: int, operation: TaskBatchOperation, exc: Exception) -> TaskBatchResult:
+        """Describe a failed batch operation"""
+        if isinstance(exc, HTTPException):
+            status_code, detail = exc.status_code, exc.detail
+        elif isinstance(exc, ValidationError):
+            status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+            detail = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+            )
+        elif isinstance(exc, DataError):
+            status_code, detail = status.HTTP_422_UNPROCESSABLE_ENTITY, "Value does not fit its column"
+        else:
+            status_code, detail = status.HTTP_409_CONFLICT, "Conflicts with existing data"
+        
+        return TaskBatchResult(
+            index=index,
+            op=operation.op,
+            task_id=operation.task_id,
+            status_code=status_code,
+            detail=detail
+        )
+    
     def get_tasks_by_date_range(self, user: User, start_date: date, end_date: date) -> List[Task]:
-        """Get tasks within a date range"""
-        return self.db.query(Task).filter(
-            Task.user_id == user.id,
-            Task.date >= start_date,
-            Task.date <= end_date
-        ).order_by(Task.date.desc(), Task.created_at.desc()).all()
+        """Get tasks within a date range, including archived history"""
+        tasks = self._task_query(Task, user, start_date, end_date).all()
+        
+        if not self._reaches_archive(user, start_date):
+            return tasks
+        
+        archived = self._task_query(ArchivedTask, user, start_date, end_date).all()
+        return self._merge_archived(tasks, archived)
+    
+    def _task_query(self, model, user: User, start_date: Optional[date], end_date: Optional[date]):
+        """Newest-first query over the hot or archived task table"""
+        query = self.db.query(model).filter(model.user_id == user.id)
+        
+        if start_date:
+            query = query.filter(model.date >= start_date)
+        if end_date:
+            query = query.filter(model.date <= end_date)
+        
+        return query.order_by(model.date.desc(), model.created_at.desc())
+    
+    def _reaches_archive(self, user: User, start_date: Optional[date]) -> bool:
+        """Whether tasks dated from start_date on may include some moved to the archive"""
+        if user.archived_before is None:
+            return False
+        return start_date is None or start_date < user.archived_before
+    
+    def _merge_archived(self, tasks: List[Task], archived: List[ArchivedTask]) -> list:
+        """Merge hot and archived rows back into newest-first order"""
+        if not archived:
+            return tasks
+        return sorted(tasks + archived, key=lambda task: (task.date, task.created_at), reverse=True)
     
     def generate_daily_summary(self, user: User, summary_date: date, format_template: str = None) -> str:
         """Generate client update summary for a specific date"""
@@ -88,6 +369,7 @@ class TaskService:
             return f"No tasks completed on {summary_date.strftime('%Y-%m-%d')}"
         
         # Convert to TaskResponse objects for the helper function
-        task_responses = [TaskResponse.from_orm(task) for task in tasks]
+        with trace_span("TaskResponse.from_orm", count=len(tasks)):
+            task_responses = [TaskResponse.from_orm(task) for task in tasks]
         
         return generate_client_update(task_responses, format_template)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from datetime import datetime, date
 from typing import List, Dict, Any
+from ..core.tracing import traced
 from ..schemas.task_schema import TaskResponse
 
 def format_date(date_obj: date) -> str:
@@ -10,6 +11,7 @@ def format_datetime(datetime_obj: datetime) -> str:
     """Format datetime to string"""
     return datetime_obj.strftime("%Y-%m-%d %H:%M:%S")
 
+@traced
 def generate_client_update(tasks: List[TaskResponse], format_template: str = None) -> str:
     """Generate client update summary from tasks"""
     if not tasks:
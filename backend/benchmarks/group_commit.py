@@ -0,0 +1,104 @@
+"""Measure task-create throughput and latency with and without group commit.
+
+Usage (from the backend directory, against the configured DATABASE_URL):
+``python -m benchmarks.group_commit --threads 32 --requests 2000``
+
+Each simulated request opens its own session, loads the user on it and calls
+TaskService.create_task, as a POST /tasks request would after get_current_user.
+The benchmark user's tasks are deleted afterwards.
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sqlalchemy import delete
+
+from app.core.config import settings
+from app.core.database import SessionLocal, create_tables
+from app.models.format_model import Format  # noqa: F401 - registers models referenced by relationships
+from app.models.task_model import Task
+from app.models.user_model import User
+from app.schemas.task_schema import TaskCreate
+from app.services.task_service import TaskService, task_group_committer
+
+BENCH_EMAIL = "group-commit-bench@example.com"
+
+def get_bench_user() -> User:
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == BENCH_EMAIL).first()
+        if user is None:
+            user = User(name="Group Commit Bench", email=BENCH_EMAIL, password="!")
+            db.add(user)
+            db.commit()
+            db.refresh(user)
+        db.expunge(user)
+        return user
+    finally:
+        db.close()
+
+def create_one(index: int) -> float:
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        # Same session work as a real request: the auth lookup holds a pooled connection
+        user = db.query(User).filter(User.email == BENCH_EMAIL).first()
+        TaskService(db).create_task(TaskCreate(task_title=f"bench {index}", date=date.today()), user)
+    finally:
+        db.close()
+    return time.perf_counter() - started
+
+def run(threads: int, requests: int) -> dict:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = sorted(executor.map(create_one, range(requests)))
+    elapsed = time.perf_counter() - started
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    return {
+        "throughput": requests / elapsed,
+        "p50": percentile(0.50),
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "max": latencies[-1] * 1000,
+        "mean": statistics.mean(latencies) * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark group commit for task creation")
+    parser.add_argument("--threads", type=int, default=32, help="Concurrent callers")
+    parser.add_argument("--requests", type=int, default=2000, help="Tasks created per mode")
+    args = parser.parse_args()
+
+    create_tables()
+    user = get_bench_user()
+
+    results = {}
+    for mode, enabled in (("per-request commit", False), ("group commit", True)):
+        settings.group_commit_enabled = enabled
+        results[mode] = run(args.threads, args.requests)
+
+    print(f"{'mode':<20}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for mode, result in results.items():
+        print(f"{mode:<20}{result['throughput']:>10.0f}{result['p50']:>10.2f}{result['p95']:>10.2f}"
+              f"{result['p99']:>10.2f}{result['max']:>10.2f}")
+
+    baseline, grouped = results["per-request commit"], results["group commit"]
+    print(f"\nThroughput gain: {grouped['throughput'] / baseline['throughput']:.2f}x, "
+          f"p99 cost: {grouped['p99'] - baseline['p99']:+.2f} ms, "
+          f"average batch: {task_group_committer.stats()['average_batch']} rows "
+          f"(window {settings.group_commit_window_ms} ms)")
+
+    db = SessionLocal()
+    try:
+        db.execute(delete(Task).where(Task.user_id == user.id))
+        db.commit()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()